@@ -45,6 +45,7 @@ class EventCopyLayer(BaseDataLayer):
         db.session.expunge(event)  # expunge the object from session
         make_transient(event)
         delattr(event, 'id')
+        delattr(event, 'listing_rank')  # generated by the database
         event.identifier = get_new_event_identifier()
         save_to_db(event)
 
@@ -64,6 +64,7 @@ def create_event_copy(identifier):
     db.session.expunge(event)  # expunge the object from session
     make_transient(event)
     delattr(event, 'id')
+    delattr(event, 'listing_rank')  # generated by the database
     event.identifier = get_new_event_identifier()
     save_to_db(event)
 
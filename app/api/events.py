@@ -1,22 +1,29 @@
 from datetime import datetime
 
 import pytz
+from celery import group
 from flask import request
-from flask_jwt_extended import current_user, get_jwt_identity, verify_jwt_in_request
+from flask_jwt_extended import current_user, get_jwt_identity
 from flask_rest_jsonapi import ResourceDetail, ResourceList, ResourceRelationship
 from flask_rest_jsonapi.exceptions import ObjectNotFound
 from marshmallow_jsonapi import fields
 from marshmallow_jsonapi.flask import Schema
-from sqlalchemy import and_, or_
-from sqlalchemy.orm.exc import NoResultFound
+from sqlalchemy import and_, bindparam, or_, select, tuple_
+from sqlalchemy.orm import load_only, selectinload
 
 from app.api.bootstrap import api
 from app.api.data_layers.EventCopyLayer import EventCopyLayer
-from app.api.helpers.db import safe_query, safe_query_kwargs, save_to_db
-from app.api.helpers.errors import ConflictError, ForbiddenError, UnprocessableEntityError
+from app.api.helpers.cache import cache
+from app.api.helpers.db import safe_query_column, safe_query_kwargs
+from app.api.helpers.errors import (
+    BadRequestError,
+    ConflictError,
+    ForbiddenError,
+    UnprocessableEntityError,
+)
 from app.api.helpers.events import create_custom_forms_for_attendees
 from app.api.helpers.export_helpers import create_export_job
-from app.api.helpers.permission_manager import has_access, is_logged_in
+from app.api.helpers.permission_manager import cached_has_access, is_logged_in
 from app.api.helpers.utilities import dasherize
 from app.api.schema.events import EventSchema, EventSchemaPublic
 
@@ -26,7 +33,7 @@ from app.models.access_code import AccessCode
 from app.models.custom_form import CustomForms
 from app.models.discount_code import DiscountCode
 from app.models.email_notification import EmailNotification
-from app.models.event import Event
+from app.models.event import PROMOTED_LISTING_RANK, Event, get_event_lists_generation
 from app.models.event_copyright import EventCopyright
 from app.models.event_invoice import EventInvoice
 from app.models.faq import Faq
@@ -34,7 +41,7 @@ from app.models.faq_type import FaqType
 from app.models.feedback import Feedback
 from app.models.microlocation import Microlocation
 from app.models.order import Order
-from app.models.role import Role
+from app.models.role import Role, get_role_ids
 from app.models.role_invite import RoleInvite
 from app.models.session import Session
 from app.models.session_type import SessionType
@@ -48,20 +55,144 @@ from app.models.ticket import Ticket, TicketTag
 from app.models.ticket_holder import TicketHolder
 from app.models.track import Track
 from app.models.user import (
-    ATTENDEE,
     COORGANIZER,
-    MARKETER,
     MODERATOR,
     ORGANIZER,
     OWNER,
     REGISTRAR,
-    SALES_ADMIN,
     TRACK_ORGANIZER,
     User,
 )
 from app.models.user_favourite_event import UserFavouriteEvent
 from app.models.users_events_role import UsersEventsRoles
 
+# User scoped event list kwargs mapped to the roles the user must hold on the event.
+# user_id comes last as the create_event permission also sets it on role specific
+# lists requested withRole, which must keep filtering on their role.
+# Marketers and sales admins are system roles, never held in users_events_roles,
+# so their lists are always empty
+USER_EVENT_ROLES = {
+    'user_owner_id': (OWNER,),
+    'user_organizer_id': (ORGANIZER,),
+    'user_coorganizer_id': (COORGANIZER,),
+    'user_track_organizer_id': (TRACK_ORGANIZER,),
+    'user_registrar_id': (REGISTRAR,),
+    'user_moderator_id': (MODERATOR,),
+    'user_marketer_id': (),
+    'user_sales_admin_id': (),
+    'user_id': (
+        OWNER,
+        ORGANIZER,
+        COORGANIZER,
+        TRACK_ORGANIZER,
+        MODERATOR,
+        REGISTRAR,
+    ),
+}
+
+# Roles whose holders can see the event even if it is not published
+MANAGER_ROLES = (COORGANIZER, ORGANIZER, OWNER)
+
+# Role filters are built once at import and bound per request with query params.
+# The subquery is not correlated to the users_events_roles join of user scoped lists
+MANAGED_EVENT_IDS = (
+    select([UsersEventsRoles.event_id])
+    .where(
+        and_(
+            UsersEventsRoles.user_id == bindparam('manager_id'),
+            UsersEventsRoles.role_id.in_(bindparam('manager_role_ids', expanding=True)),
+        )
+    )
+    .correlate(None)
+)
+
+PUBLISHED_OR_MANAGED_EVENT = or_(
+    Event.state == 'published', Event.id.in_(MANAGED_EVENT_IDS)
+)
+
+USER_EVENT_ROLE = and_(
+    UsersEventsRoles.user_id == bindparam('role_user_id'),
+    UsersEventsRoles.role_id.in_(bindparam('user_role_ids', expanding=True)),
+)
+
+# Upcoming events filters, bound per request with the current time as `now`.
+# Every comparison shares the one timestamp parameter instead of its own.
+# Events can't end before they start, so only starts_at has to be compared
+NOW = bindparam('now', type_=db.DateTime(timezone=True))
+UPCOMING_EVENT = and_(
+    Event.starts_at > NOW,
+    Event.state == 'published',
+    Event.privacy == 'public',
+)
+
+# Upcoming events which are listed, curated ones only while a ticket is on sale
+LISTED_EVENT = and_(
+    Event.listing_rank > 0,
+    or_(
+        Event.listing_rank == PROMOTED_LISTING_RANK,
+        Event.max_active_ticket_sales_ends_at > NOW,
+    ),
+)
+
+# Upcoming events after the event given as `after` cursor in the list order
+AFTER_CURSOR_EVENT = tuple_(Event.starts_at, Event.id) > tuple_(
+    bindparam('after_starts_at', type_=db.DateTime(timezone=True)),
+    bindparam('after', type_=db.Integer),
+)
+
+# Collections of the upcoming events list that are eager loaded when included
+UPCOMING_EVENT_INCLUDES = {
+    'tickets': Event.tickets,
+    'social_links': Event.social_link,
+}
+
+# Columns of upcoming events loaded whatever the sparse fieldset, the primary key
+# and the foreign keys needed to load included relationships
+EVENT_COLUMNS = set(Event.__table__.columns.keys())
+UPCOMING_EVENT_KEY_COLUMNS = (
+    'id',
+    'event_type_id',
+    'event_topic_id',
+    'event_sub_topic_id',
+    'discount_code_id',
+)
+
+# Event properties of the schema mapped to the columns they are computed from
+EVENT_PROPERTY_COLUMNS = {
+    'is_sellable': ('max_active_ticket_sales_ends_at',),
+}
+
+# Related resource kwargs mapped to the model and column used to find their event
+EVENT_ID_LOOKUPS = {
+    'sponsor_id': (Sponsor, 'id'),
+    'user_favourite_event_id': (UserFavouriteEvent, 'id'),
+    'copyright_id': (EventCopyright, 'id'),
+    'track_id': (Track, 'id'),
+    'session_type_id': (SessionType, 'id'),
+    'faq_type_id': (FaqType, 'id'),
+    'event_invoice_id': (EventInvoice, 'id'),
+    'event_invoice_identifier': (EventInvoice, 'identifier'),
+    'discount_code_id': (DiscountCode, 'id'),
+    'session_id': (Session, 'id'),
+    'social_link_id': (SocialLink, 'id'),
+    'tax_id': (Tax, 'id'),
+    'stripe_authorization_id': (StripeAuthorization, 'id'),
+    'speakers_call_id': (SpeakersCall, 'id'),
+    'ticket_id': (Ticket, 'id'),
+    'ticket_tag_id': (TicketTag, 'id'),
+    'role_invite_id': (RoleInvite, 'id'),
+    'users_events_role_id': (UsersEventsRoles, 'id'),
+    'access_code_id': (AccessCode, 'id'),
+    'speaker_id': (Speaker, 'id'),
+    'email_notification_id': (EmailNotification, 'id'),
+    'microlocation_id': (Microlocation, 'id'),
+    'attendee_id': (TicketHolder, 'id'),
+    'custom_form_id': (CustomForms, 'id'),
+    'faq_id': (Faq, 'id'),
+    'order_identifier': (Order, 'identifier'),
+    'feedback_id': (Feedback, 'id'),
+}
+
 
 def validate_event(user, data):
     if not user.can_create_event():
@@ -77,7 +208,7 @@ def validate_event(user, data):
         )
 
 
-def validate_date(event, data):
+def validate_date_order(event, data):
     if event:
         if 'starts_at' not in data:
             data['starts_at'] = event.starts_at
@@ -96,7 +227,15 @@ def validate_date(event, data):
             {'pointer': '/data/attributes/ends-at'}, "ends-at should be after starts-at"
         )
 
-    if datetime.timestamp(data['starts_at']) <= datetime.timestamp(datetime.now()):
+
+def validate_date(event, data):
+    validate_date_order(event, data)
+
+    starts_at = data['starts_at']
+    if starts_at.tzinfo is None:
+        starts_at = starts_at.replace(tzinfo=pytz.utc)
+
+    if starts_at <= datetime.now(pytz.utc):
         if event and event.deleted_at and not data.get('deleted_at'):
             data['state'] = 'draft'
         elif event and not event.deleted_at and data.get('deleted_at'):
@@ -108,7 +247,18 @@ def validate_date(event, data):
             )
 
 
+def event_list_cache_key():
+    return f'event_lists/{get_event_lists_generation()}{request.full_path}'
+
+
 class EventList(ResourceList):
+    @cache.cached(timeout=60, key_prefix=event_list_cache_key, unless=is_logged_in)
+    def get(self, *args, **kwargs):
+        """
+        Anonymous listings only depend on the url, so they are cached for a minute
+        """
+        return super().get(*args, **kwargs)
+
     def before_get(self, args, kwargs):
         """
         method for assigning schema based on admin access
@@ -116,7 +266,7 @@ class EventList(ResourceList):
         :param kwargs:
         :return:
         """
-        if is_logged_in() and (has_access('is_admin') or kwargs.get('user_id')):
+        if is_logged_in() and (cached_has_access('is_admin') or kwargs.get('user_id')):
             self.schema = EventSchema
         else:
             self.schema = EventSchemaPublic
@@ -130,146 +280,32 @@ class EventList(ResourceList):
         query_ = self.session.query(Event)
         if get_jwt_identity() is None or not current_user.is_staff:
             # If user is not admin, we only show published events
-            query_ = query_.filter_by(state='published')
-        if is_logged_in():
-            # For a specific user accessing the API, we show all
-            # events managed by them, even if they're not published
-            verify_jwt_in_request()
-            query2 = self.session.query(Event)
-            query2 = (
-                query2.join(Event.roles)
-                .filter_by(user_id=current_user.id)
-                .join(UsersEventsRoles.role)
-                .filter(
-                    or_(
-                        Role.name == COORGANIZER,
-                        Role.name == ORGANIZER,
-                        Role.name == OWNER,
-                    )
+            if is_logged_in():
+                # For a specific user accessing the API, we show all
+                # events managed by them, even if they're not published.
+                # The token has already been verified by the access check in before_get
+                query_ = query_.filter(PUBLISHED_OR_MANAGED_EVENT).params(
+                    manager_id=current_user.id,
+                    manager_role_ids=get_role_ids(MANAGER_ROLES),
                 )
-            )
-            query_ = query_.union(query2)
-
-        if view_kwargs.get('user_id') and 'GET' in request.method:
-            if not has_access('is_user_itself', user_id=int(view_kwargs['user_id'])):
-                raise ForbiddenError({'source': ''}, 'Access Forbidden')
-            user = safe_query_kwargs(User, view_kwargs, 'user_id')
-            query_ = (
-                query_.join(Event.roles)
-                .filter_by(user_id=user.id)
-                .join(UsersEventsRoles.role)
-                .filter(Role.name != ATTENDEE)
-            )
-
-        if view_kwargs.get('user_owner_id') and 'GET' in request.method:
-            if not has_access(
-                'is_user_itself', user_id=int(view_kwargs['user_owner_id'])
-            ):
-                raise ForbiddenError({'source': ''}, 'Access Forbidden')
-            user = safe_query_kwargs(User, view_kwargs, 'user_owner_id')
-            query_ = (
-                query_.join(Event.roles)
-                .filter_by(user_id=user.id)
-                .join(UsersEventsRoles.role)
-                .filter(Role.name == OWNER)
-            )
-
-        if view_kwargs.get('user_organizer_id') and 'GET' in request.method:
-            if not has_access(
-                'is_user_itself', user_id=int(view_kwargs['user_organizer_id'])
-            ):
-                raise ForbiddenError({'source': ''}, 'Access Forbidden')
-            user = safe_query_kwargs(User, view_kwargs, 'user_organizer_id')
-
-            query_ = (
-                query_.join(Event.roles)
-                .filter_by(user_id=user.id)
-                .join(UsersEventsRoles.role)
-                .filter(Role.name == ORGANIZER)
-            )
-
-        if view_kwargs.get('user_coorganizer_id') and 'GET' in request.method:
-            if not has_access(
-                'is_user_itself', user_id=int(view_kwargs['user_coorganizer_id'])
-            ):
-                raise ForbiddenError({'source': ''}, 'Access Forbidden')
-            user = safe_query_kwargs(User, view_kwargs, 'user_coorganizer_id')
-            query_ = (
-                query_.join(Event.roles)
-                .filter_by(user_id=user.id)
-                .join(UsersEventsRoles.role)
-                .filter(Role.name == COORGANIZER)
-            )
-
-        if view_kwargs.get('user_track_organizer_id') and 'GET' in request.method:
-            if not has_access(
-                'is_user_itself', user_id=int(view_kwargs['user_track_organizer_id'])
-            ):
-                raise ForbiddenError({'source': ''}, 'Access Forbidden')
-            user = safe_query(
-                User,
-                'id',
-                view_kwargs['user_track_organizer_id'],
-                'user_organizer_id',
-            )
-            query_ = (
-                query_.join(Event.roles)
-                .filter_by(user_id=user.id)
-                .join(UsersEventsRoles.role)
-                .filter(Role.name == TRACK_ORGANIZER)
-            )
-
-        if view_kwargs.get('user_registrar_id') and 'GET' in request.method:
-            if not has_access(
-                'is_user_itself', user_id=int(view_kwargs['user_registrar_id'])
-            ):
-                raise ForbiddenError({'source': ''}, 'Access Forbidden')
-            user = safe_query_kwargs(User, view_kwargs, 'user_registrar_id')
-            query_ = (
-                query_.join(Event.roles)
-                .filter_by(user_id=user.id)
-                .join(UsersEventsRoles.role)
-                .filter(Role.name == REGISTRAR)
-            )
-
-        if view_kwargs.get('user_moderator_id') and 'GET' in request.method:
-            if not has_access(
-                'is_user_itself', user_id=int(view_kwargs['user_moderator_id'])
-            ):
-                raise ForbiddenError({'source': ''}, 'Access Forbidden')
-            user = safe_query_kwargs(User, view_kwargs, 'user_moderator_id')
-            query_ = (
-                query_.join(Event.roles)
-                .filter_by(user_id=user.id)
-                .join(UsersEventsRoles.role)
-                .filter(Role.name == MODERATOR)
-            )
-
-        if view_kwargs.get('user_marketer_id') and 'GET' in request.method:
-            if not has_access(
-                'is_user_itself', user_id=int(view_kwargs['user_marketer_id'])
-            ):
-                raise ForbiddenError({'source': ''}, 'Access Forbidden')
-            user = safe_query_kwargs(User, view_kwargs, 'user_marketer_id')
-            query_ = (
-                query_.join(Event.roles)
-                .filter_by(user_id=user.id)
-                .join(UsersEventsRoles.role)
-                .filter(Role.name == MARKETER)
-            )
-
-        if view_kwargs.get('user_sales_admin_id') and 'GET' in request.method:
-            if not has_access(
-                'is_user_itself', user_id=int(view_kwargs['user_sales_admin_id'])
-            ):
-                raise ForbiddenError({'source': ''}, 'Access Forbidden')
-            user = safe_query_kwargs(User, view_kwargs, 'user_sales_admin_id')
-            query_ = (
-                query_.join(Event.roles)
-                .filter_by(user_id=user.id)
-                .join(UsersEventsRoles.role)
-                .filter(Role.name == SALES_ADMIN)
-            )
+            else:
+                query_ = query_.filter(Event.state == 'published')
+
+        if 'GET' in request.method:
+            for param, role_names in USER_EVENT_ROLES.items():
+                if not view_kwargs.get(param):
+                    continue
+                if not cached_has_access(
+                    'is_user_itself', user_id=int(view_kwargs[param])
+                ):
+                    raise ForbiddenError({'source': ''}, 'Access Forbidden')
+                user = safe_query_kwargs(User, view_kwargs, param)
+                query_ = (
+                    query_.join(Event.roles)
+                    .filter(USER_EVENT_ROLE)
+                    .params(role_user_id=user.id, user_role_ids=get_role_ids(role_names))
+                )
+                break
 
         if view_kwargs.get('event_type_id') and 'GET' in request.method:
             query_ = self.session.query(Event).filter(
@@ -288,7 +324,7 @@ class EventList(ResourceList):
 
         if view_kwargs.get('discount_code_id') and 'GET' in request.method:
             event_id = get_id(view_kwargs)['id']
-            if not has_access('is_coorganizer', event_id=event_id):
+            if not cached_has_access('is_coorganizer', event_id=event_id):
                 raise ForbiddenError({'source': ''}, 'Coorganizer access is required')
             query_ = self.session.query(Event).filter(
                 getattr(Event, 'discount_code_id') == view_kwargs['discount_code_id']
@@ -305,10 +341,13 @@ class EventList(ResourceList):
         :param data:
         :return:
         """
-        user = User.query.filter_by(id=kwargs['user_id']).first()
-        validate_event(user, data)
+        # user_id is set to the logged in user by the create_event permission, which
+        # is already loaded as current_user
+        validate_event(current_user, data)
         if data['state'] != 'draft':
             validate_date(None, data)
+        else:
+            validate_date_order(None, data)
 
     def after_create_object(self, event, data, view_kwargs):
         """
@@ -318,10 +357,12 @@ class EventList(ResourceList):
         :param view_kwargs:
         :return:
         """
-        user = User.query.filter_by(id=view_kwargs['user_id']).first()
-        role = Role.query.filter_by(name=OWNER).first()
+        user, role = (
+            db.session.query(User, Role)
+            .filter(User.id == view_kwargs['user_id'], Role.name == OWNER)
+            .one()
+        )
         uer = UsersEventsRoles(user=user, event=event, role=role)
-        save_to_db(uer, 'Event Saved')
         role_invite = RoleInvite(
             email=user.email,
             role_name=role.title_name,
@@ -329,7 +370,8 @@ class EventList(ResourceList):
             role=role,
             status='accepted',
         )
-        save_to_db(role_invite, 'Owner Role Invite Added')
+        db.session.add_all([uer, role_invite])
+        db.session.commit()
 
         # create custom forms for compulsory fields of attendee form.
         create_custom_forms_for_attendees(event)
@@ -362,260 +404,16 @@ def get_id(view_kwargs):
     :return:
     """
     if view_kwargs.get('identifier'):
-        event = safe_query_kwargs(Event, view_kwargs, 'identifier', 'identifier')
-        view_kwargs['id'] = event.id
-
-    if view_kwargs.get('sponsor_id') is not None:
-        sponsor = safe_query_kwargs(Sponsor, view_kwargs, 'sponsor_id')
-        if sponsor.event_id is not None:
-            view_kwargs['id'] = sponsor.event_id
-        else:
-            view_kwargs['id'] = None
-
-    if view_kwargs.get('user_favourite_event_id') is not None:
-        user_favourite_event = safe_query_kwargs(
-            UserFavouriteEvent,
-            view_kwargs,
-            'user_favourite_event_id',
+        view_kwargs['id'] = safe_query_column(
+            Event, 'id', view_kwargs, 'identifier', 'identifier'
         )
-        if user_favourite_event.event_id is not None:
-            view_kwargs['id'] = user_favourite_event.event_id
-        else:
-            view_kwargs['id'] = None
-
-    if view_kwargs.get('copyright_id') is not None:
-        copyright = safe_query_kwargs(EventCopyright, view_kwargs, 'copyright_id')
-        if copyright.event_id is not None:
-            view_kwargs['id'] = copyright.event_id
-        else:
-            view_kwargs['id'] = None
 
-    if view_kwargs.get('track_id') is not None:
-        track = safe_query_kwargs(Track, view_kwargs, 'track_id')
-        if track.event_id is not None:
-            view_kwargs['id'] = track.event_id
-        else:
-            view_kwargs['id'] = None
-
-    if view_kwargs.get('session_type_id') is not None:
-        session_type = safe_query_kwargs(SessionType, view_kwargs, 'session_type_id')
-        if session_type.event_id is not None:
-            view_kwargs['id'] = session_type.event_id
-        else:
-            view_kwargs['id'] = None
-
-    if view_kwargs.get('faq_type_id') is not None:
-        faq_type = safe_query_kwargs(FaqType, view_kwargs, 'faq_type_id')
-        if faq_type.event_id is not None:
-            view_kwargs['id'] = faq_type.event_id
-        else:
-            view_kwargs['id'] = None
-
-    if view_kwargs.get('event_invoice_id') is not None:
-        event_invoice = safe_query_kwargs(EventInvoice, view_kwargs, 'event_invoice_id')
-        if event_invoice.event_id is not None:
-            view_kwargs['id'] = event_invoice.event_id
-        else:
-            view_kwargs['id'] = None
-
-    if view_kwargs.get('event_invoice_identifier') is not None:
-        event_invoice = safe_query_kwargs(
-            EventInvoice, view_kwargs, 'event_invoice_identifier', 'identifier'
-        )
-        if event_invoice.event_id is not None:
-            view_kwargs['id'] = event_invoice.event_id
-        else:
-            view_kwargs['id'] = None
-
-    if view_kwargs.get('discount_code_id') is not None:
-        discount_code = safe_query_kwargs(DiscountCode, view_kwargs, 'discount_code_id')
-        if discount_code.event_id is not None:
-            view_kwargs['id'] = discount_code.event_id
-        else:
-            view_kwargs['id'] = None
-
-    if view_kwargs.get('session_id') is not None:
-        sessions = safe_query_kwargs(Session, view_kwargs, 'session_id')
-        if sessions.event_id is not None:
-            view_kwargs['id'] = sessions.event_id
-        else:
-            view_kwargs['id'] = None
-
-    if view_kwargs.get('social_link_id') is not None:
-        social_link = safe_query_kwargs(SocialLink, view_kwargs, 'social_link_id')
-        if social_link.event_id is not None:
-            view_kwargs['id'] = social_link.event_id
-        else:
-            view_kwargs['id'] = None
-
-    if view_kwargs.get('tax_id') is not None:
-        tax = safe_query_kwargs(Tax, view_kwargs, 'tax_id')
-        if tax.event_id is not None:
-            view_kwargs['id'] = tax.event_id
-        else:
-            view_kwargs['id'] = None
-
-    if view_kwargs.get('stripe_authorization_id') is not None:
-        stripe_authorization = safe_query_kwargs(
-            StripeAuthorization,
-            view_kwargs,
-            'stripe_authorization_id',
-        )
-        if stripe_authorization.event_id is not None:
-            view_kwargs['id'] = stripe_authorization.event_id
-        else:
-            view_kwargs['id'] = None
-
-    if view_kwargs.get('user_id') is not None:
-        try:
-            discount_code = (
-                db.session.query(DiscountCode)
-                .filter_by(id=view_kwargs['discount_code_id'])
-                .one()
-            )
-        except NoResultFound:
-            raise ObjectNotFound(
-                {'parameter': 'discount_code_id'},
-                "DiscountCode: {} not found".format(view_kwargs['discount_code_id']),
+    for parameter_name, (model, column_name) in EVENT_ID_LOOKUPS.items():
+        if view_kwargs.get(parameter_name) is not None:
+            view_kwargs['id'] = safe_query_column(
+                model, 'event_id', view_kwargs, parameter_name, column_name
             )
-        else:
-            if discount_code.event_id is not None:
-                view_kwargs['id'] = discount_code.event_id
-            else:
-                view_kwargs['id'] = None
-
-    if view_kwargs.get('speakers_call_id') is not None:
-        speakers_call = safe_query_kwargs(SpeakersCall, view_kwargs, 'speakers_call_id')
-        if speakers_call.event_id is not None:
-            view_kwargs['id'] = speakers_call.event_id
-        else:
-            view_kwargs['id'] = None
-
-    if view_kwargs.get('ticket_id') is not None:
-        ticket = safe_query_kwargs(Ticket, view_kwargs, 'ticket_id')
-        if ticket.event_id is not None:
-            view_kwargs['id'] = ticket.event_id
-        else:
-            view_kwargs['id'] = None
-
-    if view_kwargs.get('ticket_tag_id') is not None:
-        ticket_tag = safe_query_kwargs(TicketTag, view_kwargs, 'ticket_tag_id')
-        if ticket_tag.event_id is not None:
-            view_kwargs['id'] = ticket_tag.event_id
-        else:
-            view_kwargs['id'] = None
-
-    if view_kwargs.get('role_invite_id') is not None:
-        role_invite = safe_query_kwargs(RoleInvite, view_kwargs, 'role_invite_id')
-        if role_invite.event_id is not None:
-            view_kwargs['id'] = role_invite.event_id
-        else:
-            view_kwargs['id'] = None
-
-    if view_kwargs.get('users_events_role_id') is not None:
-        users_events_role = safe_query_kwargs(
-            UsersEventsRoles,
-            view_kwargs,
-            'users_events_role_id',
-        )
-        if users_events_role.event_id is not None:
-            view_kwargs['id'] = users_events_role.event_id
-
-    if view_kwargs.get('access_code_id') is not None:
-        access_code = safe_query_kwargs(AccessCode, view_kwargs, 'access_code_id')
-        if access_code.event_id is not None:
-            view_kwargs['id'] = access_code.event_id
-        else:
-            view_kwargs['id'] = None
-
-    if view_kwargs.get('speaker_id'):
-        try:
-            speaker = (
-                db.session.query(Speaker).filter_by(id=view_kwargs['speaker_id']).one()
-            )
-        except NoResultFound:
-            raise ObjectNotFound(
-                {'parameter': 'speaker_id'},
-                "Speaker: {} not found".format(view_kwargs['speaker_id']),
-            )
-        else:
-            if speaker.event_id:
-                view_kwargs['id'] = speaker.event_id
-            else:
-                view_kwargs['id'] = None
-
-    if view_kwargs.get('email_notification_id'):
-        try:
-            email_notification = (
-                db.session.query(EmailNotification)
-                .filter_by(id=view_kwargs['email_notification_id'])
-                .one()
-            )
-        except NoResultFound:
-            raise ObjectNotFound(
-                {'parameter': 'email_notification_id'},
-                "Email Notification: {} not found".format(
-                    view_kwargs['email_notification_id']
-                ),
-            )
-        else:
-            if email_notification.event_id:
-                view_kwargs['id'] = email_notification.event_id
-            else:
-                view_kwargs['id'] = None
-
-    if view_kwargs.get('microlocation_id'):
-        try:
-            microlocation = (
-                db.session.query(Microlocation)
-                .filter_by(id=view_kwargs['microlocation_id'])
-                .one()
-            )
-        except NoResultFound:
-            raise ObjectNotFound(
-                {'parameter': 'microlocation_id'},
-                "Microlocation: {} not found".format(view_kwargs['microlocation_id']),
-            )
-        else:
-            if microlocation.event_id:
-                view_kwargs['id'] = microlocation.event_id
-            else:
-                view_kwargs['id'] = None
-
-    if view_kwargs.get('attendee_id'):
-        attendee = safe_query_kwargs(TicketHolder, view_kwargs, 'attendee_id')
-        if attendee.event_id is not None:
-            view_kwargs['id'] = attendee.event_id
-        else:
-            view_kwargs['id'] = None
-
-    if view_kwargs.get('custom_form_id') is not None:
-        custom_form = safe_query_kwargs(CustomForms, view_kwargs, 'custom_form_id')
-        if custom_form.event_id is not None:
-            view_kwargs['id'] = custom_form.event_id
-        else:
-            view_kwargs['id'] = None
-
-    if view_kwargs.get('faq_id') is not None:
-        faq = safe_query_kwargs(Faq, view_kwargs, 'faq_id')
-        if faq.event_id is not None:
-            view_kwargs['id'] = faq.event_id
-        else:
-            view_kwargs['id'] = None
-
-    if view_kwargs.get('order_identifier') is not None:
-        order = safe_query_kwargs(Order, view_kwargs, 'order_identifier', 'identifier')
-        if order.event_id is not None:
-            view_kwargs['id'] = order.event_id
-        else:
-            view_kwargs['id'] = None
-
-    if view_kwargs.get('feedback_id') is not None:
-        feedback = safe_query_kwargs(Feedback, view_kwargs, 'feedback_id')
-        if feedback.event_id is not None:
-            view_kwargs['id'] = feedback.event_id
-        else:
-            view_kwargs['id'] = None
+            break
 
     return view_kwargs
 
@@ -633,7 +431,7 @@ class EventDetail(ResourceDetail):
         :return:
         """
         kwargs = get_id(kwargs)
-        if is_logged_in() and has_access('is_coorganizer', event_id=kwargs['id']):
+        if is_logged_in() and cached_has_access('is_coorganizer', event_id=kwargs['id']):
             self.schema = EventSchema
         else:
             self.schema = EventSchemaPublic
@@ -646,18 +444,11 @@ class EventDetail(ResourceDetail):
         """
         get_id(view_kwargs)
 
-        if view_kwargs.get('order_identifier') is not None:
-            order = safe_query_kwargs(
-                Order, view_kwargs, 'order_identifier', 'identifier'
-            )
-            if order.event_id is not None:
-                view_kwargs['id'] = order.event_id
-            else:
-                view_kwargs['id'] = None
-
     def after_get_object(self, event, view_kwargs):
         if event and event.state == "draft":
-            if not is_logged_in() or not has_access('is_coorganizer', event_id=event.id):
+            if not is_logged_in() or not cached_has_access(
+                'is_coorganizer', event_id=event.id
+            ):
                 raise ObjectNotFound({'parameter': '{id}'}, "Event: not found")
 
     def before_patch(self, args, kwargs, data=None):
@@ -669,8 +460,7 @@ class EventDetail(ResourceDetail):
         :param data:
         :return:
         """
-        user = User.query.filter_by(id=current_user.id).one()
-        validate_event(user, data)
+        validate_event(current_user, data)
 
     def before_update_object(self, event, data, view_kwargs):
         """
@@ -690,8 +480,11 @@ class EventDetail(ResourceDetail):
         if is_date_updated or is_draft_published or is_event_restored:
             validate_date(event, data)
 
-        if has_access('is_admin') and data.get('deleted_at') != event.deleted_at:
-            if len(event.orders) != 0 and not has_access('is_super_admin'):
+        if cached_has_access('is_admin') and data.get('deleted_at') != event.deleted_at:
+            has_orders = db.session.query(
+                Order.query.filter_by(event_id=event.id).exists()
+            ).scalar()
+            if has_orders and not cached_has_access('is_super_admin'):
                 raise ForbiddenError(
                     {'source': ''}, "Event associated with orders cannot be deleted"
                 )
@@ -783,28 +576,21 @@ class EventCopyResource(ResourceList):
     methods = [
         'POST',
     ]
-    data_layer = {'class': EventCopyLayer, 'session': db.Session}
+    data_layer = {'class': EventCopyLayer, 'session': db.session}
 
 
 def start_export_tasks(event):
     event_id = str(event.id)
-    # XCAL
-    from .helpers.tasks import export_xcal_task
-
-    task_xcal = export_xcal_task.delay(event_id, temp=False)
-    create_export_job(task_xcal.id, event_id)
+    from .helpers.tasks import export_ical_task, export_pentabarf_task, export_xcal_task
 
-    # ICAL
-    from .helpers.tasks import export_ical_task
-
-    task_ical = export_ical_task.delay(event_id, temp=False)
-    create_export_job(task_ical.id, event_id)
-
-    # PENTABARF XML
-    from .helpers.tasks import export_pentabarf_task
-
-    task_pentabarf = export_pentabarf_task.delay(event_id, temp=False)
-    create_export_job(task_pentabarf.id, event_id)
+    # XCAL, ICAL and PENTABARF XML are sent to the broker together
+    exports = group(
+        export_xcal_task.s(event_id, temp=False),
+        export_ical_task.s(event_id, temp=False),
+        export_pentabarf_task.s(event_id, temp=False),
+    ).apply_async()
+    # An event has a single export job, tracking the last export of the group
+    create_export_job(exports.results[-1].id, event_id)
 
 
 def start_image_resizing_tasks(event, original_image_url):
@@ -815,10 +601,33 @@ def start_image_resizing_tasks(event, original_image_url):
 
 
 def clear_export_urls(event):
-    event.ical_url = None
-    event.xcal_url = None
-    event.pentabarf_url = None
-    save_to_db(event)
+    db.session.query(Event).filter(
+        Event.id == event.id,
+        or_(
+            Event.ical_url != None,
+            Event.xcal_url != None,
+            Event.pentabarf_url != None,
+        ),
+    ).update(
+        {'ical_url': None, 'xcal_url': None, 'pentabarf_url': None},
+        synchronize_session=False,
+    )
+    db.session.commit()
+
+
+def get_current_minute():
+    """
+    Current time truncated to the minute, shared by all upcoming event requests
+    in that minute
+    """
+    return datetime.now(pytz.utc).replace(second=0, microsecond=0)
+
+
+def upcoming_events_cache_key():
+    return (
+        f'event_lists/{get_event_lists_generation()}/'
+        f'{get_current_minute().isoformat()}{request.full_path}'
+    )
 
 
 class UpcomingEventList(EventList):
@@ -826,6 +635,14 @@ class UpcomingEventList(EventList):
     List Upcoming Events
     """
 
+    @cache.cached(timeout=60, key_prefix=upcoming_events_cache_key, unless=is_logged_in)
+    def get(self, *args, **kwargs):
+        """
+        Anonymous listings are cached per minute of the time they are listed at,
+        instead of by the url only as in EventList
+        """
+        return super(EventList, self).get(*args, **kwargs)
+
     def before_get(self, args, kwargs):
         """
         method for assigning schema based on admin access
@@ -842,29 +659,53 @@ class UpcomingEventList(EventList):
         :param view_kwargs:
         :return:
         """
-        current_time = datetime.now(pytz.utc)
-        query_ = (
-            self.session.query(Event)
-            .filter(
-                Event.starts_at > current_time,
-                Event.ends_at > current_time,
-                Event.state == 'published',
-                Event.privacy == 'public',
-                or_(
-                    Event.is_promoted,
-                    and_(
-                        Event.original_image_url != None,
-                        Event.logo_url != None,
-                        Event.event_type_id != None,
-                        Event.event_topic_id != None,
-                        Event.event_sub_topic_id != None,
-                        Event.tickets.any(and_(Ticket.deleted_at == None, Ticket.is_hidden == False, Ticket.sales_ends_at > current_time)),
-                        Event.social_link.any(SocialLink.name=="twitter")
-                    ),
-                ),
+        query_ = self.session.query(Event).filter(UPCOMING_EVENT, LISTED_EVENT)
+        params = {'now': get_current_minute()}
+        # Pages can be fetched from the last event of the previous one instead of
+        # with an offset, so that the preceding events don't have to be skipped
+        after = request.args.get('after')
+        if after:
+            if not after.isdigit():
+                raise BadRequestError(
+                    {'parameter': 'after'}, "after should be the id of an event"
+                )
+            query_ = query_.filter(AFTER_CURSOR_EVENT)
+            params['after'] = int(after)
+            # The cursor must be a listed event itself, or the events returned after
+            # it would reveal where a hidden event starts
+            params['after_starts_at'] = (
+                self.session.query(Event.starts_at)
+                .filter(Event.id == params['after'], Event.deleted_at == None)
+                .filter(UPCOMING_EVENT, LISTED_EVENT)
+                .params(now=params['now'])
+                .scalar()
+            )
+            if params['after_starts_at'] is None:
+                raise ObjectNotFound({'parameter': 'after'}, f"Event: {after} not found")
+        query_ = query_.params(**params).order_by(Event.starts_at, Event.id)
+        # Included collections are serialized for every event of the page, so
+        # load each of them in one query instead of lazily per event
+        includes = {
+            path.split('.')[0].replace('-', '_')
+            for path in request.args.get('include', '').split(',')
+        }
+        query_ = query_.options(
+            *(
+                selectinload(relationship)
+                for name, relationship in UPCOMING_EVENT_INCLUDES.items()
+                if name in includes
             )
-            .order_by(Event.starts_at)
         )
+        # Only the columns of a requested sparse fieldset are serialized
+        fields = request.args.get('fields[event]')
+        if fields:
+            columns = set()
+            for field in fields.split(','):
+                field = field.replace('-', '_')
+                columns.update(EVENT_PROPERTY_COLUMNS.get(field, (field,)))
+            query_ = query_.options(
+                load_only(*UPCOMING_EVENT_KEY_COLUMNS, *(columns & EVENT_COLUMNS))
+            )
         return query_
 
     data_layer = {
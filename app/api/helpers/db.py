@@ -102,6 +102,37 @@ def safe_query(model, column_name, value, parameter_name):
     )
 
 
+def safe_query_column(
+    model, select_column_name, kwargs, parameter_name, column_name='id'
+):
+    """
+    Wrapper query to fetch a single column of a record instead of the whole row
+    :param model: db Model to be queried
+    :param select_column_name: name of the column whose value is returned eg 'event_id'
+    :param kwargs: it contains parameter_name's value eg kwargs['event_id']
+                where parameter_name='event_id'
+    :param parameter_name: Name of parameter to be printed in json-api error
+                message eg 'event_id'
+    :param column_name: Name of column default is 'id'.
+    :return: value of the selected column
+    """
+    value = kwargs[parameter_name]
+    query = db.session.query(getattr(model, select_column_name)).filter(
+        getattr(model, column_name) == value
+    )
+    if request.args.get('get_trashed') != 'true' and hasattr(model, 'deleted_at'):
+        query = query.filter(model.deleted_at == None)
+    try:
+        (selected,) = query.one()
+    except NoResultFound:
+        raise ObjectNotFound(
+            {'parameter': f'{parameter_name}'},
+            f"{model.__name__}: {value} not found",
+        )
+    else:
+        return selected
+
+
 def get_or_create(model, **kwargs):
     """
     This function queries a record in the model, if not found it will create one.
@@ -533,5 +533,22 @@ def has_access(access_level, **kwargs):
     return False
 
 
+def cached_has_access(access_level, **kwargs):
+    """
+    Same as has_access, but the result is memoized for the rest of the request
+    so repeated checks don't reload the user from the JWT and database
+    :param string access_level: name of access level
+    :param dict kwargs: This is directly passed to permission manager
+    :return: bool: True if passes the access else False
+    """
+    cache = getattr(request, 'access_cache', None)
+    if cache is None:
+        cache = request.access_cache = {}
+    key = (access_level, tuple(sorted(kwargs.items())))
+    if key not in cache:
+        cache[key] = has_access(access_level, **kwargs)
+    return cache[key]
+
+
 def is_logged_in() -> bool:
     return 'Authorization' in request.headers
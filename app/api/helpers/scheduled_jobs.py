@@ -165,7 +165,9 @@ def send_monthly_event_invoice(send_notification: bool = True):
     ).with_entities(distinct(Order.event_id))
     # SQLAlchemy returns touples instead of list of IDs
     last_order_event_ids = [r[0] for r in last_order_event_ids]
-    events = (
+    # Only the IDs are needed instead of every event. They are all fetched before
+    # dispatching, as eager tasks commit the session a streaming cursor would read
+    event_ids = (
         Event.query.filter(Event.owner != None)
         .filter(
             or_(
@@ -174,11 +176,12 @@ def send_monthly_event_invoice(send_notification: bool = True):
                 Event.id.in_(last_order_event_ids),
             )
         )
+        .with_entities(Event.id)
         .all()
     )
 
-    for event in events:
-        send_event_invoice.delay(event.id, send_notification=send_notification)
+    for (event_id,) in event_ids:
+        send_event_invoice.delay(event_id, send_notification=send_notification)
 
 
 @celery.task(base=RequestContextTask, bind=True, max_retries=5)
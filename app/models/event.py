@@ -1,12 +1,14 @@
 from argparse import Namespace
 from datetime import datetime
+from uuid import uuid4
 
 import flask_login as login
 import pytz
 from flask import current_app
-from sqlalchemy import event
+from sqlalchemy import event, exists, inspect, orm, select
 from sqlalchemy.sql import func
 
+from app.api.helpers.cache import cache
 from app.api.helpers.db import get_new_identifier
 from app.models import db
 from app.models.base import SoftDeletionModel
@@ -17,6 +19,7 @@ from app.models.helpers.versioning import clean_html, clean_up_string
 from app.models.order import Order
 from app.models.search import sync
 from app.models.session import Session
+from app.models.social_link import SocialLink
 from app.models.speaker import Speaker
 from app.models.ticket import Ticket
 from app.models.ticket_fee import get_fee, get_maximum_fee
@@ -25,6 +28,12 @@ from app.models.user import ATTENDEE, ORGANIZER, OWNER
 from app.settings import get_settings
 
 
+# Listing ranks of events: promoted events are listed first, curated events are
+# listed while their tickets are on sale, other events are not listed
+PROMOTED_LISTING_RANK = 2
+CURATED_LISTING_RANK = 1
+
+
 def get_new_event_identifier(length=8):
     return get_new_identifier(Event, length=length)
 
@@ -33,7 +42,31 @@ class Event(SoftDeletionModel):
     """Event object table"""
 
     __tablename__ = 'events'
-    __versioned__ = {'exclude': ['schedule_published_on', 'created_at']}
+    __versioned__ = {
+        'exclude': [
+            'schedule_published_on',
+            'created_at',
+            'has_twitter_link',
+            'max_active_ticket_sales_ends_at',
+            'listing_rank',
+        ]
+    }
+    __table_args__ = (
+        db.Index(
+            'ix_event_published_starts',
+            'starts_at',
+            postgresql_where=db.text("state = 'published'"),
+        ),
+        db.Index(
+            'ix_event_listed_upcoming',
+            'starts_at',
+            'id',
+            postgresql_where=db.text(
+                "listing_rank > 0 AND state = 'published' AND privacy = 'public'"
+            ),
+        ),
+        db.CheckConstraint('ends_at >= starts_at', name='ck_event_ends_after_starts'),
+    )
     id = db.Column(db.Integer, primary_key=True)
     identifier = db.Column(db.String, default=get_new_event_identifier)
     name = db.Column(db.String, nullable=False)
@@ -49,6 +82,20 @@ class Event(SoftDeletionModel):
     searchable_location_name = db.Column(db.String)
     is_featured = db.Column(db.Boolean, default=False, nullable=False)
     is_promoted = db.Column(db.Boolean, default=False, nullable=False)
+    has_twitter_link = db.Column(
+        db.Boolean, default=False, nullable=False, server_default='False'
+    )
+    max_active_ticket_sales_ends_at = db.Column(db.DateTime(timezone=True))
+    listing_rank = db.Column(
+        db.SmallInteger,
+        db.Computed(
+            f'CASE WHEN is_promoted THEN {PROMOTED_LISTING_RANK}'
+            ' WHEN original_image_url IS NOT NULL AND logo_url IS NOT NULL'
+            ' AND event_type_id IS NOT NULL AND event_topic_id IS NOT NULL'
+            ' AND event_sub_topic_id IS NOT NULL AND has_twitter_link'
+            f' THEN {CURATED_LISTING_RANK} ELSE 0 END'
+        ),
+    )
     description = db.Column(db.Text)
     original_image_url = db.Column(db.String)
     thumbnail_image_url = db.Column(db.String)
@@ -74,7 +121,7 @@ class Event(SoftDeletionModel):
     feedbacks = db.relationship('Feedback', backref="event")
     attendees = db.relationship('TicketHolder', backref="event")
     privacy = db.Column(db.String, default="public")
-    state = db.Column(db.String, default="draft")
+    state = db.Column(db.Enum("draft", "published", name="event_state"), default="draft")
     event_type_id = db.Column(
         db.Integer, db.ForeignKey('event_types.id', ondelete='CASCADE')
     )
@@ -251,6 +298,16 @@ class Event(SoftDeletionModel):
         event_topic = EventTopic.query.filter_by(id=event_topic_id).first()
         return event_topic.system_image_url
 
+    @property
+    def is_sellable(self):
+        """
+        Returns whether a visible ticket of this event is still on sale
+        """
+        return (
+            self.max_active_ticket_sales_ends_at is not None
+            and self.max_active_ticket_sales_ends_at > datetime.now(pytz.utc)
+        )
+
     @property
     def fee(self):
         """
@@ -452,3 +509,146 @@ def receive_after_delete(mapper, connection, target):
     """
     if current_app.config['ENABLE_ELASTICSEARCH']:
         sync.mark_event(sync.REDIS_EVENT_DELETE, target.id)
+
+
+# Cached event lists are keyed by a generation which is replaced when events change,
+# so that they are invalidated without clearing the rest of the cache
+EVENT_LISTS_GENERATION_KEY = 'event_lists/generation'
+
+
+def clear_cached_event_lists():
+    """
+    Start a new generation of cached event lists
+    :return: the new generation
+    """
+    generation = uuid4().hex
+    cache.set(EVENT_LISTS_GENERATION_KEY, generation, timeout=0)
+    return generation
+
+
+def get_event_lists_generation():
+    """
+    Current generation of cached event lists, starting a new one if the cache
+    has lost it
+    """
+    generation = cache.get(EVENT_LISTS_GENERATION_KEY)
+    if generation is None:
+        generation = clear_cached_event_lists()
+    return generation
+
+
+def mark_event_lists_changed(target):
+    """
+    Flag the session of the target to clear the cached event lists once it commits,
+    so that lists cached meanwhile by concurrent requests don't outlive the change
+    """
+    orm.object_session(target).info['event_lists_changed'] = True
+
+
+@event.listens_for(Event, 'after_insert')
+@event.listens_for(Event, 'after_update')
+@event.listens_for(Event, 'after_delete')
+def receive_event_change(mapper, connection, target):
+    """
+    listen for changes of events to clear the cached event lists
+    """
+    mark_event_lists_changed(target)
+
+
+@event.listens_for(orm.Session, 'after_commit')
+def receive_after_commit(session):
+    """
+    Clear the cached event lists if events were changed in the transaction
+    """
+    if session.info.pop('event_lists_changed', False):
+        clear_cached_event_lists()
+
+
+@event.listens_for(orm.Session, 'after_rollback')
+def receive_after_rollback(session):
+    """
+    Keep the cached event lists when the changes of events are rolled back
+    """
+    session.info.pop('event_lists_changed', None)
+
+
+def update_related_events(connection, target, **values):
+    """
+    Update columns of the events a related record belongs or belonged to
+    :param connection: connection of the flush
+    :param target: related record having an event_id
+    :param values: column expressions to be set on the events
+    """
+    event_ids = {target.event_id, *inspect(target).attrs.event_id.history.deleted}
+    event_ids.discard(None)
+    if not event_ids:
+        return
+    events = Event.__table__
+    connection.execute(events.update().where(events.c.id.in_(event_ids)).values(**values))
+    mark_event_lists_changed(target)
+
+
+def has_changes(target, *attributes):
+    """
+    Whether any of the given attributes of the target was changed in the flush
+    """
+    attrs = inspect(target).attrs
+    return any(attrs[name].history.has_changes() for name in attributes)
+
+
+@event.listens_for(SocialLink, 'after_insert')
+@event.listens_for(SocialLink, 'after_delete')
+def receive_social_link_change(mapper, connection, target):
+    """
+    Recompute has_twitter_link of the events the social link belongs or belonged to
+    """
+    social_links = SocialLink.__table__
+    has_twitter_link = exists().where(
+        (social_links.c.event_id == Event.__table__.c.id)
+        & (social_links.c.name == 'twitter')
+    )
+    update_related_events(connection, target, has_twitter_link=has_twitter_link)
+
+
+@event.listens_for(SocialLink, 'after_update')
+def receive_social_link_update(mapper, connection, target):
+    """
+    Recompute has_twitter_link only when the name or the event of the social link
+    changed
+    """
+    if has_changes(target, 'name', 'event_id'):
+        receive_social_link_change(mapper, connection, target)
+
+
+@event.listens_for(Ticket, 'after_insert')
+@event.listens_for(Ticket, 'after_delete')
+def receive_ticket_change(mapper, connection, target):
+    """
+    Recompute max_active_ticket_sales_ends_at of the events the ticket belongs or
+    belonged to
+    """
+    tickets = Ticket.__table__
+    max_active_ticket_sales_ends_at = (
+        select([func.max(tickets.c.sales_ends_at)])
+        .where(
+            (tickets.c.event_id == Event.__table__.c.id)
+            & (tickets.c.deleted_at == None)
+            & (tickets.c.is_hidden == False)
+        )
+        .as_scalar()
+    )
+    update_related_events(
+        connection,
+        target,
+        max_active_ticket_sales_ends_at=max_active_ticket_sales_ends_at,
+    )
+
+
+@event.listens_for(Ticket, 'after_update')
+def receive_ticket_update(mapper, connection, target):
+    """
+    Recompute max_active_ticket_sales_ends_at only when a column it depends on
+    changed
+    """
+    if has_changes(target, 'event_id', 'sales_ends_at', 'deleted_at', 'is_hidden'):
+        receive_ticket_change(mapper, connection, target)
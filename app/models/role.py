@@ -1,3 +1,7 @@
+from functools import lru_cache
+
+from sqlalchemy import event
+
 from app.models import db
 
 
@@ -12,3 +16,38 @@ class Role(db.Model):
 
     def __repr__(self):
         return '<Role %r>' % self.name
+
+
+@lru_cache(maxsize=1)
+def get_role_id_map():
+    """
+    Mapping of role name to role id, or None for names known not to exist. Event
+    roles are seeded once and rarely change, so the table is read once per process
+    """
+    return dict(db.session.query(Role.name, Role.id))
+
+
+def get_role_ids(names):
+    """
+    Ids of the roles with the given names, skipping the ones that don't exist.
+    The mapping is reloaded once when a name is missing from it, as the roles may
+    have been seeded by another process after it was read. Names still missing are
+    remembered so that they don't reload the mapping again
+    """
+    role_ids = get_role_id_map()
+    if not role_ids.keys() >= set(names):
+        get_role_id_map.cache_clear()
+        role_ids = get_role_id_map()
+        for name in names:
+            role_ids.setdefault(name, None)
+    return [role_ids[name] for name in names if role_ids[name] is not None]
+
+
+@event.listens_for(Role, 'after_insert')
+@event.listens_for(Role, 'after_update')
+@event.listens_for(Role, 'after_delete')
+def clear_role_id_map(mapper, connection, target):
+    """
+    listen for role changes to reload the role id mapping
+    """
+    get_role_id_map.cache_clear()
@@ -0,0 +1,29 @@
+"""Add partial index on starts_at of published events
+
+Revision ID: 0fa2464f9874
+Revises: 060a77f9a1ea
+Create Date: 2026-10-15 10:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0fa2464f9874'
+down_revision = '060a77f9a1ea'
+
+
+def upgrade():
+    op.create_index(
+        'ix_event_published_starts',
+        'events',
+        ['starts_at'],
+        unique=False,
+        postgresql_where=sa.text("state = 'published'"),
+    )
+
+
+def downgrade():
+    op.drop_index('ix_event_published_starts', table_name='events')
@@ -0,0 +1,33 @@
+"""Add has_twitter_link flag to events
+
+Revision ID: 3b7e52d1c0a4
+Revises: 0fa2464f9874
+Create Date: 2026-10-15 11:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3b7e52d1c0a4'
+down_revision = '0fa2464f9874'
+
+
+def upgrade():
+    op.add_column(
+        'events',
+        sa.Column(
+            'has_twitter_link', sa.Boolean(), server_default='False', nullable=False
+        ),
+    )
+    op.execute(
+        "UPDATE events SET has_twitter_link = true WHERE EXISTS "
+        "(SELECT 1 FROM social_links WHERE social_links.event_id = events.id "
+        "AND social_links.name = 'twitter');"
+    )
+
+
+def downgrade():
+    op.drop_column('events', 'has_twitter_link')
@@ -0,0 +1,34 @@
+"""Add max_active_ticket_sales_ends_at to events
+
+Revision ID: 9d2c41f7a8e3
+Revises: 3b7e52d1c0a4
+Create Date: 2026-10-15 12:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9d2c41f7a8e3'
+down_revision = '3b7e52d1c0a4'
+
+
+def upgrade():
+    op.add_column(
+        'events',
+        sa.Column(
+            'max_active_ticket_sales_ends_at', sa.DateTime(timezone=True), nullable=True
+        ),
+    )
+    op.execute(
+        "UPDATE events SET max_active_ticket_sales_ends_at = "
+        "(SELECT max(tickets.sales_ends_at) FROM tickets "
+        "WHERE tickets.event_id = events.id AND tickets.deleted_at IS NULL "
+        "AND tickets.is_hidden = false);"
+    )
+
+
+def downgrade():
+    op.drop_column('events', 'max_active_ticket_sales_ends_at')
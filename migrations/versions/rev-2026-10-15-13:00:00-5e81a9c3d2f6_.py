@@ -0,0 +1,28 @@
+"""Add events end after start constraint
+
+Revision ID: 5e81a9c3d2f6
+Revises: 9d2c41f7a8e3
+Create Date: 2026-10-15 13:00:00.000000
+
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '5e81a9c3d2f6'
+down_revision = '9d2c41f7a8e3'
+
+
+def upgrade():
+    # Drafts were saved without checking their dates, so some may end before they
+    # start. The constraint is only enforced on new and updated rows, leaving the
+    # existing ones as they are until their dates are fixed.
+    op.execute(
+        "ALTER TABLE events ADD CONSTRAINT ck_event_ends_after_starts "
+        "CHECK (ends_at >= starts_at) NOT VALID;"
+    )
+
+
+def downgrade():
+    op.drop_constraint('ck_event_ends_after_starts', 'events', type_='check')
@@ -0,0 +1,21 @@
+"""Add partial index on starts_at of promoted public events
+
+Superseded by the listed upcoming events index of 7c4f2d9e0a13, so nothing is built.
+
+Revision ID: a4f07c2e91b8
+Revises: 5e81a9c3d2f6
+Create Date: 2026-10-15 14:00:00.000000
+
+"""
+
+# revision identifiers, used by Alembic.
+revision = 'a4f07c2e91b8'
+down_revision = '5e81a9c3d2f6'
+
+
+def upgrade():
+    pass
+
+
+def downgrade():
+    pass
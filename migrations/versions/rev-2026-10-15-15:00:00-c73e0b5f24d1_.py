@@ -0,0 +1,21 @@
+"""Add generated is_listable column to events
+
+Superseded by the generated listing_rank column of 7c4f2d9e0a13, so nothing is built.
+
+Revision ID: c73e0b5f24d1
+Revises: a4f07c2e91b8
+Create Date: 2026-10-15 15:00:00.000000
+
+"""
+
+# revision identifiers, used by Alembic.
+revision = 'c73e0b5f24d1'
+down_revision = 'a4f07c2e91b8'
+
+
+def upgrade():
+    pass
+
+
+def downgrade():
+    pass
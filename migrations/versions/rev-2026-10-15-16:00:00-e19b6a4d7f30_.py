@@ -0,0 +1,21 @@
+"""Add starts_at, id index on events
+
+Superseded by the listed upcoming events index of 7c4f2d9e0a13, so nothing is built.
+
+Revision ID: e19b6a4d7f30
+Revises: c73e0b5f24d1
+Create Date: 2026-10-15 16:00:00.000000
+
+"""
+
+# revision identifiers, used by Alembic.
+revision = 'e19b6a4d7f30'
+down_revision = 'c73e0b5f24d1'
+
+
+def upgrade():
+    pass
+
+
+def downgrade():
+    pass
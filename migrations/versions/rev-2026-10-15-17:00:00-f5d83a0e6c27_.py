@@ -0,0 +1,50 @@
+"""Store event state as an enum
+
+Revision ID: f5d83a0e6c27
+Revises: e19b6a4d7f30
+Create Date: 2026-10-15 17:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'f5d83a0e6c27'
+down_revision = 'e19b6a4d7f30'
+
+event_state = postgresql.ENUM('draft', 'published', name='event_state')
+
+# Partial indexes on the state are recreated so that their predicates compare
+# the enum instead of the state cast to text
+STATE_INDEXES = {
+    'ix_event_published_starts': "state = 'published'",
+}
+
+
+def alter_state(type_, using):
+    for name in STATE_INDEXES:
+        op.drop_index(name, table_name='events')
+    for table in ('events', 'events_version'):
+        op.alter_column(table, 'state', type_=type_, postgresql_using=using)
+    for name, where in STATE_INDEXES.items():
+        op.create_index(
+            name, 'events', ['starts_at'], unique=False, postgresql_where=sa.text(where)
+        )
+
+
+def upgrade():
+    event_state.create(op.get_bind())
+    # Like the earlier state normalization, anything but published is a draft
+    alter_state(
+        event_state,
+        "(CASE WHEN state IS NULL THEN NULL WHEN state = 'published' "
+        "THEN 'published' ELSE 'draft' END)::event_state",
+    )
+
+
+def downgrade():
+    alter_state(sa.String(), 'state::text')
+    event_state.drop(op.get_bind())
@@ -0,0 +1,21 @@
+"""Match upcoming event indexes to the upcoming events query
+
+Superseded by the listed upcoming events index of 7c4f2d9e0a13, so nothing is built.
+
+Revision ID: 2a6c9e1b7d45
+Revises: f5d83a0e6c27
+Create Date: 2026-10-15 18:00:00.000000
+
+"""
+
+# revision identifiers, used by Alembic.
+revision = '2a6c9e1b7d45'
+down_revision = 'f5d83a0e6c27'
+
+
+def upgrade():
+    pass
+
+
+def downgrade():
+    pass
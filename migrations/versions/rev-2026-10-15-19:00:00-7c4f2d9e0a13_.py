@@ -0,0 +1,40 @@
+"""Add generated listing_rank column to events and listed upcoming events index
+
+Revision ID: 7c4f2d9e0a13
+Revises: 2a6c9e1b7d45
+Create Date: 2026-10-15 19:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7c4f2d9e0a13'
+down_revision = '2a6c9e1b7d45'
+
+
+def upgrade():
+    op.execute(
+        "ALTER TABLE events ADD COLUMN listing_rank smallint GENERATED ALWAYS AS "
+        "(CASE WHEN is_promoted THEN 2 "
+        "WHEN original_image_url IS NOT NULL AND logo_url IS NOT NULL "
+        "AND event_type_id IS NOT NULL AND event_topic_id IS NOT NULL "
+        "AND event_sub_topic_id IS NOT NULL AND has_twitter_link "
+        "THEN 1 ELSE 0 END) STORED;"
+    )
+    op.create_index(
+        'ix_event_listed_upcoming',
+        'events',
+        ['starts_at', 'id'],
+        unique=False,
+        postgresql_where=sa.text(
+            "listing_rank > 0 AND state = 'published' AND privacy = 'public'"
+        ),
+    )
+
+
+def downgrade():
+    op.drop_index('ix_event_listed_upcoming', table_name='events')
+    op.drop_column('events', 'listing_rank')
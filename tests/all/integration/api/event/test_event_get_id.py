@@ -0,0 +1,34 @@
+import pytest
+from flask_rest_jsonapi.exceptions import ObjectNotFound
+
+from app.api.events import get_id
+from tests.factories.event import EventFactoryBasic
+from tests.factories.track import TrackSubFactory
+
+
+def test_get_id_identifier(db):
+    event = EventFactoryBasic()
+    db.session.commit()
+
+    assert get_id({'identifier': event.identifier})['id'] == event.id
+
+
+def test_get_id_related_resource(db):
+    track = TrackSubFactory()
+    db.session.commit()
+
+    assert get_id({'track_id': track.id})['id'] == track.event_id
+
+
+def test_get_id_related_resource_not_found(db):
+    with pytest.raises(ObjectNotFound):
+        get_id({'track_id': 1234})
+
+
+def test_get_id_ignores_user_id(db):
+    event = EventFactoryBasic()
+    db.session.commit()
+
+    view_kwargs = get_id({'id': event.id, 'user_id': 1})
+
+    assert view_kwargs['id'] == event.id
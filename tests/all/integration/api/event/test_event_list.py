@@ -0,0 +1,81 @@
+from app.models.user import ATTENDEE, ORGANIZER, OWNER
+from tests.all.integration.utils import get_event, get_event_ids
+from tests.factories.event import EventFactoryBasic
+
+
+def test_user_events_exclude_attendee_role(db, client, user, jwt):
+    owned = get_event(db, user, OWNER)
+    organized = get_event(db, user, ORGANIZER)
+    attended = get_event(db, user, ATTENDEE)
+
+    response = client.get(
+        f'/v1/users/{user.id}/events',
+        content_type='application/vnd.api+json',
+        headers=jwt,
+    )
+
+    assert response.status_code == 200
+    event_ids = get_event_ids(response)
+    assert {owned.id, organized.id} <= event_ids
+    assert attended.id not in event_ids
+
+
+def test_user_owner_events(db, client, user, jwt):
+    owned = get_event(db, user, OWNER)
+    organized = get_event(db, user, ORGANIZER)
+
+    response = client.get(
+        f'/v1/users/{user.id}/owner-events',
+        content_type='application/vnd.api+json',
+        headers=jwt,
+    )
+
+    assert response.status_code == 200
+    event_ids = get_event_ids(response)
+    assert owned.id in event_ids
+    assert organized.id not in event_ids
+
+
+def test_user_owner_events_with_role(db, client, user, jwt):
+    owned = get_event(db, user, OWNER)
+    organized = get_event(db, user, ORGANIZER)
+
+    response = client.get(
+        f'/v1/users/{user.id}/owner-events?withRole',
+        content_type='application/vnd.api+json',
+        headers=jwt,
+    )
+
+    assert response.status_code == 200
+    event_ids = get_event_ids(response)
+    assert owned.id in event_ids
+    assert organized.id not in event_ids
+
+
+def test_user_events_other_user_forbidden(db, client, admin_user, jwt):
+    response = client.get(
+        f'/v1/users/{admin_user.id}/owner-events',
+        content_type='application/vnd.api+json',
+        headers=jwt,
+    )
+
+    assert response.status_code == 403
+
+
+def test_event_list_includes_managed_drafts(db, client, user, jwt):
+    published = EventFactoryBasic(state='published')
+    draft = EventFactoryBasic(state='draft')
+    owned_draft = get_event(db, user, OWNER, state='draft')
+    attended_draft = get_event(db, user, ATTENDEE, state='draft')
+
+    response = client.get(
+        '/v1/events',
+        content_type='application/vnd.api+json',
+        headers=jwt,
+    )
+
+    assert response.status_code == 200
+    event_ids = get_event_ids(response)
+    assert {published.id, owned_draft.id} <= event_ids
+    assert draft.id not in event_ids
+    assert attended_draft.id not in event_ids
@@ -0,0 +1,97 @@
+import json
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+import pytz
+
+from app.api.events import upcoming_events_cache_key
+from app.api.helpers.cache import cache
+from app.models.user import OWNER
+from tests.all.integration.utils import get_counting_queries, get_event, get_event_ids
+from tests.factories.event import EventFactoryBasic
+
+
+@pytest.fixture
+def simple_cache(app):
+    cache.init_app(app, config={'CACHE_TYPE': 'simple'})
+    yield cache
+    cache.init_app(app, config={'CACHE_TYPE': 'null'})
+
+
+def test_anonymous_event_list_cached(db, client, simple_cache):
+    EventFactoryBasic(state='published')
+    db.session.commit()
+
+    response, _ = get_counting_queries(client, '/v1/events')
+    cached_response, query_count = get_counting_queries(client, '/v1/events')
+
+    assert cached_response.status_code == 200
+    assert query_count == 0
+    assert json.loads(cached_response.data) == json.loads(response.data)
+
+
+def test_logged_in_event_list_not_cached(db, client, user, jwt, simple_cache):
+    draft = get_event(db, user, OWNER, state='draft')
+
+    response, _ = get_counting_queries(client, '/v1/events')
+    assert draft.id not in get_event_ids(response)
+
+    response, query_count = get_counting_queries(client, '/v1/events', headers=jwt)
+
+    assert query_count > 0
+    assert draft.id in get_event_ids(response)
+
+
+def test_event_list_cache_cleared_on_event_update(db, client, simple_cache):
+    event = EventFactoryBasic(state='published')
+    db.session.commit()
+
+    response, _ = get_counting_queries(client, '/v1/events')
+    assert event.id in get_event_ids(response)
+
+    event.state = 'draft'
+    db.session.commit()
+
+    response, query_count = get_counting_queries(client, '/v1/events')
+
+    assert query_count > 0
+    assert event.id not in get_event_ids(response)
+
+
+def test_event_list_cache_cleared_on_commit_only(db, client, simple_cache):
+    cache.set('unrelated', 'value')
+    event = EventFactoryBasic(state='published')
+    db.session.commit()
+
+    get_counting_queries(client, '/v1/events')
+
+    event.state = 'draft'
+    db.session.flush()
+
+    response, query_count = get_counting_queries(client, '/v1/events')
+    assert query_count == 0
+    assert event.id in get_event_ids(response)
+
+    db.session.commit()
+
+    response, query_count = get_counting_queries(client, '/v1/events')
+    assert query_count > 0
+    assert event.id not in get_event_ids(response)
+    assert cache.get('unrelated') == 'value'
+
+
+def test_upcoming_events_cache_key_changes_with_minute(app, simple_cache):
+    with app.test_request_context('/v1/events/upcoming?page[size]=10'), patch(
+        'app.api.events.datetime'
+    ) as datetime_mock:
+        datetime_mock.now.return_value = datetime(2099, 1, 1, 10, 0, 15, tzinfo=pytz.utc)
+        key = upcoming_events_cache_key()
+        datetime_mock.now.return_value = datetime(2099, 1, 1, 10, 0, 45, tzinfo=pytz.utc)
+        same_minute_key = upcoming_events_cache_key()
+        datetime_mock.now.return_value = datetime(2099, 1, 1, 10, 1, 5, tzinfo=pytz.utc)
+        next_minute_key = upcoming_events_cache_key()
+
+    assert key == same_minute_key
+    assert key != next_minute_key
+    assert '/v1/events/upcoming' in key
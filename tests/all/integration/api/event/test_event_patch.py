@@ -1,6 +1,7 @@
 import json
 
 from tests.factories.event import EventFactoryBasic
+from tests.factories.order import OrderSubFactory
 
 
 def get_event(db):
@@ -65,3 +66,76 @@ def test_edit_event_null_field(db, client, admin_jwt):
 
     assert response.status_code == 200
     assert event.location_name is None
+
+
+def test_edit_draft_event_clears_export_urls(db, client, admin_jwt):
+    event = get_event(db)
+
+    assert event.ical_url is not None
+
+    data = json.dumps(
+        {
+            'data': {
+                'type': 'event',
+                'id': str(event.id),
+                'attributes': {'location-name': 'Berlin'},
+            }
+        }
+    )
+
+    response = client.patch(
+        f'/v1/events/{event.id}',
+        content_type='application/vnd.api+json',
+        headers=admin_jwt,
+        data=data,
+    )
+
+    db.session.refresh(event)
+
+    assert response.status_code == 200
+    assert event.location_name == 'Berlin'
+    assert event.ical_url is None
+    assert event.xcal_url is None
+    assert event.pentabarf_url is None
+
+
+def delete_event(client, event, jwt):
+    data = json.dumps(
+        {
+            'data': {
+                'type': 'event',
+                'id': str(event.id),
+                'attributes': {'deleted-at': '2099-01-01T00:00:00+00:00'},
+            }
+        }
+    )
+
+    return client.patch(
+        f'/v1/events/{event.id}',
+        content_type='application/vnd.api+json',
+        headers=jwt,
+        data=data,
+    )
+
+
+def test_delete_event_with_orders_error(db, client, admin_jwt):
+    order = OrderSubFactory()
+    db.session.commit()
+
+    response = delete_event(client, order.event, admin_jwt)
+
+    db.session.refresh(order.event)
+
+    assert response.status_code == 403
+    assert order.event.deleted_at is None
+
+
+def test_delete_event_without_orders(db, client, admin_jwt):
+    event = get_event(db)
+
+    response = delete_event(client, event, admin_jwt)
+
+    db.session.refresh(event)
+
+    assert response.status_code == 200
+    assert event.deleted_at is not None
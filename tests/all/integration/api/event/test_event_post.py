@@ -0,0 +1,75 @@
+import json
+
+from app.api.helpers.db import get_or_create
+from app.models.role import Role
+from app.models.role_invite import RoleInvite
+from app.models.user import OWNER
+from app.models.users_events_role import UsersEventsRoles
+
+
+def test_create_event_owner_role(db, client, admin_user, admin_jwt):
+    role, _ = get_or_create(Role, name=OWNER, title_name='Owner')
+
+    data = json.dumps(
+        {
+            'data': {
+                'type': 'event',
+                'attributes': {
+                    'name': 'Event',
+                    'timezone': 'UTC',
+                    'state': 'draft',
+                    'starts-at': '2099-06-01T10:00:00+00:00',
+                    'ends-at': '2099-06-02T10:00:00+00:00',
+                },
+            }
+        }
+    )
+
+    response = client.post(
+        '/v1/events',
+        content_type='application/vnd.api+json',
+        headers=admin_jwt,
+        data=data,
+    )
+
+    assert response.status_code == 201
+    event_id = int(json.loads(response.data)['data']['id'])
+
+    uer = UsersEventsRoles.query.filter_by(event_id=event_id).one()
+    assert uer.user_id == admin_user.id
+    assert uer.role_id == role.id
+
+    role_invite = RoleInvite.query.filter_by(event_id=event_id).one()
+    assert role_invite.email == admin_user.email
+    assert role_invite.role_id == role.id
+    assert role_invite.role_name == 'Owner'
+    assert role_invite.status == 'accepted'
+
+
+def test_create_draft_event_ending_before_start(db, client, admin_jwt):
+    data = json.dumps(
+        {
+            'data': {
+                'type': 'event',
+                'attributes': {
+                    'name': 'Event',
+                    'timezone': 'UTC',
+                    'state': 'draft',
+                    'starts-at': '2099-06-02T10:00:00+00:00',
+                    'ends-at': '2099-06-01T10:00:00+00:00',
+                },
+            }
+        }
+    )
+
+    response = client.post(
+        '/v1/events',
+        content_type='application/vnd.api+json',
+        headers=admin_jwt,
+        data=data,
+    )
+
+    assert response.status_code == 422
+    assert json.loads(response.data)['errors'][0]['source'] == {
+        'pointer': '/data/attributes/ends-at'
+    }
@@ -0,0 +1,143 @@
+import json
+from datetime import datetime, timedelta
+
+import pytz
+
+from app.models.social_link import SocialLink
+from tests.all.integration.utils import get_counting_queries, get_event_ids
+from tests.factories.event import EventFactoryBasic
+from tests.factories.ticket import TicketSubFactory
+
+
+def test_upcoming_events(db, client):
+    now = datetime.now(pytz.utc)
+    promoted = EventFactoryBasic(state='published', is_promoted=True)
+    not_curated = EventFactoryBasic(state='published')
+    draft = EventFactoryBasic(is_promoted=True)
+    ended = EventFactoryBasic(
+        state='published',
+        is_promoted=True,
+        starts_at=now - timedelta(days=2),
+        ends_at=now - timedelta(days=1),
+    )
+    db.session.commit()
+
+    response = client.get('/v1/events/upcoming', content_type='application/vnd.api+json')
+
+    assert response.status_code == 200
+    event_ids = get_event_ids(response)
+    assert promoted.id in event_ids
+    assert not {not_curated.id, draft.id, ended.id} & event_ids
+
+
+def test_upcoming_events_sparse_fieldset(db, client):
+    event = EventFactoryBasic(state='published', is_promoted=True)
+    db.session.commit()
+
+    response = client.get(
+        '/v1/events/upcoming?fields[event]=name,starts-at',
+        content_type='application/vnd.api+json',
+    )
+
+    assert response.status_code == 200
+    data = json.loads(response.data)['data']
+    assert data[0]['id'] == str(event.id)
+    assert set(data[0]['attributes']) == {'name', 'starts-at'}
+
+
+def test_upcoming_events_after_cursor(db, client):
+    first = EventFactoryBasic(state='published', is_promoted=True)
+    second = EventFactoryBasic(state='published', is_promoted=True)
+    db.session.commit()
+
+    response = client.get(
+        f'/v1/events/upcoming?after={first.id}&page[size]=1',
+        content_type='application/vnd.api+json',
+    )
+
+    assert response.status_code == 200
+    assert get_event_ids(response) == {second.id}
+
+
+def test_upcoming_events_invalid_after_cursor(db, client):
+    response = client.get(
+        '/v1/events/upcoming?after=abc', content_type='application/vnd.api+json'
+    )
+
+    assert response.status_code == 400
+
+
+def test_upcoming_events_sparse_fieldset_property(db, client):
+    url = '/v1/events/upcoming?fields[event]=name,is-sellable'
+    EventFactoryBasic(state='published', is_promoted=True)
+    db.session.commit()
+
+    response, query_count = get_counting_queries(client, url)
+
+    assert response.status_code == 200
+    data = json.loads(response.data)['data']
+    assert set(data[0]['attributes']) == {'name', 'is-sellable'}
+    assert data[0]['attributes']['is-sellable'] is False
+
+    EventFactoryBasic.create_batch(2, state='published', is_promoted=True)
+    db.session.commit()
+
+    response, more_events_query_count = get_counting_queries(client, url)
+
+    assert len(json.loads(response.data)['data']) == 3
+    assert more_events_query_count == query_count
+
+
+def get_event_with_ticket_and_link():
+    event = EventFactoryBasic(state='published', is_promoted=True)
+    TicketSubFactory(event=event)
+    SocialLink(name='twitter', link='https://twitter.com/event', event=event)
+    return event
+
+
+def test_upcoming_events_include(db, client):
+    url = '/v1/events/upcoming?include=tickets,social-links'
+    get_event_with_ticket_and_link()
+    db.session.commit()
+
+    response, query_count = get_counting_queries(client, url)
+
+    assert response.status_code == 200
+    included = json.loads(response.data)['included']
+    assert sorted(resource['type'] for resource in included) == [
+        'social-link',
+        'ticket',
+    ]
+
+    get_event_with_ticket_and_link()
+    get_event_with_ticket_and_link()
+    db.session.commit()
+
+    response, more_events_query_count = get_counting_queries(client, url)
+
+    included = json.loads(response.data)['included']
+    assert len(included) == 6
+    assert more_events_query_count == query_count
+
+
+def test_upcoming_events_missing_after_cursor(db, client):
+    response = client.get(
+        '/v1/events/upcoming?after=1234', content_type='application/vnd.api+json'
+    )
+
+    assert response.status_code == 404
+
+
+def test_upcoming_events_hidden_after_cursor(db, client):
+    draft = EventFactoryBasic(is_promoted=True)
+    private = EventFactoryBasic(state='published', is_promoted=True, privacy='private')
+    EventFactoryBasic(state='published', is_promoted=True)
+    db.session.commit()
+
+    for event in (draft, private):
+        response = client.get(
+            f'/v1/events/upcoming?after={event.id}',
+            content_type='application/vnd.api+json',
+        )
+
+        assert response.status_code == 404
@@ -8,6 +8,7 @@ from app.api.helpers.db import (
     get_or_create,
     safe_query,
     safe_query_by_id,
+    safe_query_column,
     save_to_db,
 )
 from app.models.event import Event
@@ -83,3 +84,22 @@ def test_allow_deleted_event_for_admin(db, app):
         event = safe_query(Event, 'id', obj.id, 'id')
         assert event.id == obj.id
         assert event == obj
+
+
+def test_safe_query_column(db):
+    """Method to test the function safe_query_column"""
+
+    event = EventFactoryBasic()
+    db.session.commit()
+    event_id = safe_query_column(
+        Event, 'id', {'identifier': event.identifier}, 'identifier', 'identifier'
+    )
+    assert event_id == event.id
+
+
+def test_safe_query_column_filter_deleted(db):
+    event = EventFactoryBasic(deleted_at=datetime.now())
+    db.session.commit()
+
+    with pytest.raises(ObjectNotFound):
+        safe_query_column(Event, 'id', {'event_id': event.id}, 'event_id')
@@ -6,9 +6,11 @@ from app.api.helpers.db import get_or_create, save_to_db
 from app.api.helpers.errors import ForbiddenError
 from app.api.helpers.permission_manager import (
     accessible_role_based_events,
+    cached_has_access,
     has_access,
     permission_manager,
 )
+from app.models.user import User
 from app.models.users_events_role import UsersEventsRoles
 from tests.all.integration.utils import OpenEventLegacyTestCase
 from tests.factories.event import EventFactoryBasic
@@ -39,6 +41,19 @@ class TestPermissionManager(OpenEventLegacyTestCase):
             self.assertFalse(has_access('is_super_admin'))
             self.assertTrue(has_access('is_organizer', event_id=1))
 
+    def test_cached_has_access(self):
+        """Method to test that access is memoized for a single request"""
+
+        with self.app.test_request_context(headers=self.auth):
+            self.assertTrue(cached_has_access('is_admin'))
+            user = User.query.get(1)
+            user.is_admin = False
+            save_to_db(user)
+            self.assertTrue(cached_has_access('is_admin'))
+
+        with self.app.test_request_context(headers=self.auth):
+            self.assertFalse(cached_has_access('is_admin'))
+
     def test_accessible_role_based_events(self):
         """Method to test accessible role of a user based on an event"""
 
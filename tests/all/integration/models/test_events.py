@@ -0,0 +1,116 @@
+from datetime import datetime
+
+import pytest
+import pytz
+from flask_sqlalchemy import get_debug_queries
+from sqlalchemy.exc import IntegrityError
+
+from app.models.event import CURATED_LISTING_RANK, PROMOTED_LISTING_RANK
+from app.models.event_sub_topic import EventSubTopic
+from app.models.social_link import SocialLink
+from tests.factories.event import EventFactoryBasic
+from tests.factories.event_topic import EventTopicFactory
+from tests.factories.event_type import EventTypeFactory
+from tests.factories.ticket import TicketSubFactory
+
+
+def test_has_twitter_link(db):
+    event = EventFactoryBasic()
+    link = SocialLink(name='twitter', link='https://twitter.com/event', event=event)
+    db.session.commit()
+    db.session.refresh(event)
+
+    assert event.has_twitter_link
+
+    link.name = 'facebook'
+    db.session.commit()
+    db.session.refresh(event)
+
+    assert not event.has_twitter_link
+
+    link.name = 'twitter'
+    db.session.commit()
+    db.session.delete(link)
+    db.session.commit()
+    db.session.refresh(event)
+
+    assert not event.has_twitter_link
+
+
+def test_max_active_ticket_sales_ends_at(db):
+    event = EventFactoryBasic()
+    visible = TicketSubFactory(
+        event=event, is_hidden=False, sales_ends_at=datetime(2030, 1, 1, tzinfo=pytz.utc)
+    )
+    TicketSubFactory(
+        event=event, is_hidden=True, sales_ends_at=datetime(2031, 1, 1, tzinfo=pytz.utc)
+    )
+    db.session.commit()
+    db.session.refresh(event)
+
+    assert event.max_active_ticket_sales_ends_at == datetime(2030, 1, 1, tzinfo=pytz.utc)
+    assert event.is_sellable
+
+    visible.deleted_at = datetime.now(pytz.utc)
+    db.session.commit()
+    db.session.refresh(event)
+
+    assert event.max_active_ticket_sales_ends_at is None
+    assert not event.is_sellable
+
+
+def get_event_updates():
+    return [
+        query
+        for query in get_debug_queries()
+        if query.statement.startswith('UPDATE events ')
+    ]
+
+
+def test_unrelated_ticket_and_social_link_changes_keep_event(db):
+    event = EventFactoryBasic()
+    ticket = TicketSubFactory(event=event)
+    link = SocialLink(name='twitter', link='https://twitter.com/event', event=event)
+    db.session.commit()
+    event_updates = len(get_event_updates())
+
+    ticket.description = 'Updated'
+    link.link = 'https://twitter.com/updated'
+    db.session.commit()
+
+    assert len(get_event_updates()) == event_updates
+
+
+def test_event_cannot_end_before_start(db):
+    EventFactoryBasic(
+        starts_at=datetime(2099, 12, 14, tzinfo=pytz.utc),
+        ends_at=datetime(2099, 12, 13, tzinfo=pytz.utc),
+    )
+
+    with pytest.raises(IntegrityError):
+        db.session.commit()
+
+
+def test_listing_rank(db):
+    event = EventFactoryBasic()
+    db.session.commit()
+    db.session.refresh(event)
+
+    assert event.listing_rank == 0
+
+    event.event_type = EventTypeFactory()
+    event.event_topic = EventTopicFactory()
+    event.event_sub_topic = EventSubTopic(
+        name='Sub Topic', slug='sub-topic', event_topic=event.event_topic
+    )
+    SocialLink(name='twitter', link='https://twitter.com/event', event=event)
+    db.session.commit()
+    db.session.refresh(event)
+
+    assert event.listing_rank == CURATED_LISTING_RANK
+
+    event.is_promoted = True
+    db.session.commit()
+    db.session.refresh(event)
+
+    assert event.listing_rank == PROMOTED_LISTING_RANK
@@ -0,0 +1,38 @@
+from flask_sqlalchemy import get_debug_queries
+
+from app.models.role import Role, get_role_ids
+from app.models.user import ORGANIZER, OWNER
+from tests.factories.role import RoleFactory
+
+
+def test_get_role_ids(db):
+    owner = RoleFactory(name=OWNER)
+    db.session.commit()
+
+    assert get_role_ids([OWNER, ORGANIZER]) == [owner.id]
+
+    organizer = RoleFactory(name=ORGANIZER)
+    db.session.commit()
+
+    assert get_role_ids([OWNER, ORGANIZER]) == [owner.id, organizer.id]
+
+
+def test_get_role_ids_reloads_missing_roles(db):
+    assert get_role_ids([ORGANIZER]) == []
+
+    # Roles seeded by another process don't clear the mapping of this one
+    db.session.execute(Role.__table__.insert().values(name=OWNER))
+    owner = Role.query.filter_by(name=OWNER).one()
+
+    assert get_role_ids([OWNER]) == [owner.id]
+
+
+def test_get_role_ids_remembers_missing_roles(db):
+    owner = RoleFactory(name=OWNER)
+    db.session.commit()
+
+    assert get_role_ids([OWNER, ORGANIZER]) == [owner.id]
+    queries = len(get_debug_queries())
+
+    assert get_role_ids([OWNER, ORGANIZER]) == [owner.id]
+    assert len(get_debug_queries()) == queries
@@ -1,8 +1,15 @@
+import json
 import unittest
 
+from flask_sqlalchemy import get_debug_queries
+
+from app.api.helpers.db import get_or_create
+from app.models.role import Role
 from app.models.user import User
+from app.models.users_events_role import UsersEventsRoles
 from tests.all.integration.auth_helper import create_super_admin
 from tests.all.integration.setup_database import Setup, db
+from tests.factories.event import EventFactoryBasic
 
 
 def get_or_create_super_admin():
@@ -12,6 +19,25 @@ def get_or_create_super_admin():
     return user
 
 
+def get_event(db, user, role_name, **kwargs):
+    event = EventFactoryBasic(**kwargs)
+    role, _ = get_or_create(Role, name=role_name)
+    UsersEventsRoles(user=user, event=event, role=role)
+    db.session.commit()
+
+    return event
+
+
+def get_event_ids(response):
+    return {int(event['id']) for event in json.loads(response.data)['data']}
+
+
+def get_counting_queries(client, url, headers=None):
+    query_count = len(get_debug_queries())
+    response = client.get(url, content_type='application/vnd.api+json', headers=headers)
+    return response, len(get_debug_queries()) - query_count
+
+
 class OpenEventLegacyTestCase(unittest.TestCase):
     """Sets up and tears down database on each run of tests
     Only use for those tests where OpenEventTestCase does not work"""
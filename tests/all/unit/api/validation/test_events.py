@@ -0,0 +1,67 @@
+from datetime import datetime, timedelta
+from unittest import TestCase
+
+import pytz
+
+from app.api.events import validate_date, validate_date_order
+from app.api.helpers.errors import UnprocessableEntityError
+
+
+class TestEventValidation(TestCase):
+    def test_date_pass(self):
+        """
+        Events Validate Date - Tests if the function runs without an exception
+        :return:
+        """
+        now = datetime.now(pytz.utc)
+        data = {'starts_at': now + timedelta(days=1), 'ends_at': now + timedelta(days=2)}
+        validate_date(None, data)
+
+    def test_date_naive_pass(self):
+        """
+        Events Validate Date - Tests if naive dates are treated as UTC
+        :return:
+        """
+        now = datetime.utcnow()
+        data = {'starts_at': now + timedelta(days=1), 'ends_at': now + timedelta(days=2)}
+        validate_date(None, data)
+
+    def test_date_start_in_past(self):
+        """
+        Events Validate Date - Tests if exception is raised when starts_at is in the past
+        :return:
+        """
+        now = datetime.now(pytz.utc)
+        data = {'starts_at': now - timedelta(days=1), 'ends_at': now + timedelta(days=1)}
+        with self.assertRaises(UnprocessableEntityError):
+            validate_date(None, data)
+
+    def test_date_start_gt_end(self):
+        """
+        Events Validate Date - Tests if exception is raised when ends_at is before starts_at
+        :return:
+        """
+        now = datetime.now(pytz.utc)
+        data = {'starts_at': now + timedelta(days=2), 'ends_at': now + timedelta(days=1)}
+        with self.assertRaises(UnprocessableEntityError):
+            validate_date(None, data)
+
+    def test_date_order_past_pass(self):
+        """
+        Events Validate Date Order - Tests if ordered dates in the past are accepted
+        :return:
+        """
+        now = datetime.now(pytz.utc)
+        data = {'starts_at': now - timedelta(days=2), 'ends_at': now - timedelta(days=1)}
+        validate_date_order(None, data)
+
+    def test_date_order_start_gt_end(self):
+        """
+        Events Validate Date Order - Tests if exception is raised when ends_at is before
+        starts_at
+        :return:
+        """
+        now = datetime.now(pytz.utc)
+        data = {'starts_at': now - timedelta(days=1), 'ends_at': now - timedelta(days=2)}
+        with self.assertRaises(UnprocessableEntityError):
+            validate_date_order(None, data)